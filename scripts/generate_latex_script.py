@@ -1,6 +1,10 @@
+import os
+from itertools import chain, islice, repeat
 from pathlib import Path
 import argparse
 
+_HSPACE_NL = "\\hspace{0cm}%\n"
+
 
 class LatexFileGenerator():
     """
@@ -30,6 +34,78 @@ class LatexFileGenerator():
         have the same physical size.
     """
 
+    # Static LaTeX templates, rendered once at class-definition time so the
+    # per-run methods only substitute the variable parts. LaTeX needs literal
+    # '%', so %-substitution templates double it as '%%'.
+    _HEADER_TMPL = r"""\documentclass[12pt,%s,notitlepage,landscape]{article}
+\usepackage{graphicx}
+\usepackage{subcaption}
+\usepackage{pdflscape}
+\usepackage[space]{grffile}
+
+\pagenumbering{gobble}
+
+\addtolength{\topmargin}{-3.4cm}
+\begin{document}
+
+"""
+    _HEADERS = {True: _HEADER_TMPL % "a4paper",
+                False: _HEADER_TMPL % "letterpaper"}
+
+    _SHEET_TMPL = r"""\clearpage
+
+\begin{figure}[ht]
+\centering
+\makebox[1\textwidth]{
+\includegraphics[height=14cm]{" %(p)s "} \hspace{0cm}%%
+\includegraphics[height=14cm]{" %(p)s "}
+}
+\end{figure}
+
+"""
+
+    _MAT_TMPL = r"""\begin{figure}[ht]
+        \centering
+        \makebox[1\textwidth]{
+            \includegraphics[angle=90,width=9.5cm,height=14.5cm]{" %(front)s "}\hspace{0.5cm}%%
+            \includegraphics[angle=90,width=9.5cm,height=14.5cm]{" %(back)s "}\hspace{0.5cm}%%
+            \raisebox{7.5cm}[0pt][0pt]{%%
+                \parbox[c]{4cm}{
+                    \includegraphics[width=4cm]{" %(mini)s "}\\[0.5cm]
+                    \scalebox{-1}[1]{\includegraphics[width=4cm]{" %(mini)s "}}%%
+                }
+            }
+        }
+        
+        \vspace{0.5cm}
+        \makebox[1\textwidth]{%%
+"""
+
+    _AMD_PAGE_OPEN = r"""\begin{figure}[ht]
+  \centering
+\setkeys{Gin}{width=6.9cm}
+\makebox[1\textwidth]{
+"""
+
+    _ABILITY_PAGE_OPEN = r"""\begin{figure}[ht]
+  \centering
+\setkeys{Gin}{width=%s}
+\makebox[1\textwidth]{
+"""
+
+    _ROW_BREAK = r"""
+}
+\makebox[\textwidth]{
+"""
+
+    _PAGE_CLOSE = r"""
+}
+\end{figure}
+
+\clearpage
+
+"""
+
     def __init__(self,
                  path_to_root_dir: str,
                  output_path: str,
@@ -40,288 +116,238 @@ class LatexFileGenerator():
         self.is_a4 = is_a4
         self.has_bleed = has_bleed
         self.rotate_amd_cards = True
+        # Constants that only depend on the paper format / bleed choice,
+        # computed once instead of on every page. The width makes sure the
+        # final cards have the same physical size (ie cards printed with
+        # bleed, but with bleed cut out, and cards printed without bleed).
+        self._cards_per_line = 3 if (not is_a4 and has_bleed) else 4
+        self._ability_width = "6.99cm" if has_bleed else "6.35cm"
+        # Index the root directory once: a name set for the folder checks and
+        # a stem -> full path dict for the singleton assets (backs, token,
+        # mat, sheet...), replacing repeated exists() probes with dict
+        # lookups. Entries are sorted so that .jpg wins over .png for a
+        # same-named pair, as before.
+        self._root_entries = set()
+        self._root_index = {}
+        with os.scandir(self.path_to_root_dir) as it:
+            for entry in sorted(it, key=lambda e: e.name):
+                self._root_entries.add(entry.name)
+                if entry.is_file():
+                    self._root_index.setdefault(Path(entry.name).stem, entry.path)
         self.check_root_dir_consistency()
 
+    @staticmethod
     def sanitize_path(p: str) -> str:
+        """
+        Turns Windows separators into the forward slashes LaTeX expects.
+        A single str.replace walks the string once in C (and returns the
+        original object when there is nothing to replace); spaces need no
+        escaping because every emitted path is quoted and the preamble loads
+        grffile with the [space] option.
+        """
         return p.replace("\\", "/")
 
+    @staticmethod
+    def _list_images(dir_path) -> list[str]:
+        """
+        Lists all the .jpg/.png files in dir_path in a single directory scan,
+        returning sorted, already-sanitized path strings.
+        """
+        with os.scandir(dir_path) as it:
+            entries = [(e.name, e.path) for e in it if e.is_file() and e.name.lower().endswith((".jpg", ".png"))]
+        # Sort on the basename only: within one folder the order is the same
+        # as sorting the full paths, but the comparison keys are much shorter.
+        entries.sort()
+        return [LatexFileGenerator.sanitize_path(path) for _, path in entries]
+
     def check_root_dir_consistency(self):
         """
         Raises an error is the root directory doesn't have the correct structure.
         """
-        if not Path(self.path_to_root_dir / "AbilityCards").exists():
+        if "AbilityCards" not in self._root_entries:
             raise ValueError(f"Missing folder with the name AbilityCards in {self.path_to_root_dir}")
-        if not Path(self.path_to_root_dir / "AMD").exists():
+        if "AMD" not in self._root_entries:
             raise ValueError(f"Missing folder with the name AMD in {self.path_to_root_dir}")
 
         for filename in ["ability_card_back", "amd_back", "non_amd_back", "character_token", "character_mat",
                          "character_mat_back", "character_mini", "character_sheet"]:
-            if not Path(self.path_to_root_dir / filename).with_suffix(".jpg").exists() and not Path(
-                    self.path_to_root_dir / filename).with_suffix(".png").exists():
+            if filename not in self._root_index:
                 raise ValueError(f"Missing file {filename} (JPG or PNG format) in {self.path_to_root_dir}")
 
     def generate_latex_file(self):
-        latex_code = self.header()
-        # Ability cards
-        card_paths = list(Path(self.path_to_root_dir / "AbilityCards").glob("*.jpg")) + list(
-            Path(self.path_to_root_dir / "AbilityCards").glob("*.png"))
-        card_paths.sort()
-        card_back_path = Path(self.path_to_root_dir / "ability_card_back.jpg")
-        if not card_back_path.exists():
-            card_back_path = Path(self.path_to_root_dir / "ability_card_back.png")
-        card_paths = [LatexFileGenerator.sanitize_path(str(p)) for p in (card_paths)]
-        card_back_path = LatexFileGenerator.sanitize_path(str(card_back_path))
-        latex_code += self.ability_cards([str(c) for c in card_paths], str(card_back_path))
-
-        # #AMD
-        amd_paths = list(Path(self.path_to_root_dir / "AMD").glob("*.jpg")) + list(
-            Path(self.path_to_root_dir / "AMD").glob("*.png"))
-        amd_paths.sort()
-        amd_back_path = Path(self.path_to_root_dir / "amd_back.jpg")
-        if not amd_back_path.exists():
-            amd_back_path = Path(self.path_to_root_dir / "amd_back.png")
-        amd_backs = [amd_back_path for _ in amd_paths]
-
-        # NON_AMD
-        non_amd_paths = list(Path(self.path_to_root_dir / "NON_AMD").glob("*.jpg")) + \
-                        list(Path(self.path_to_root_dir / "NON_AMD").glob("*.png"))
-        non_amd_paths.sort()
-        non_amd_back_path = Path(self.path_to_root_dir / "non_amd_back.jpg")
-        if not non_amd_back_path.exists():
-            non_amd_back_path = Path(self.path_to_root_dir / "non_amd_back.png")
-        non_amd_backs = [non_amd_back_path for _ in non_amd_paths]
-
-        # Characater tokens
-        character_token_path = Path(self.path_to_root_dir / "character_token.jpg")
-        if not character_token_path.exists():
-            character_token_path = Path(self.path_to_root_dir / "character_token.png")
-        character_token_path = LatexFileGenerator.sanitize_path(str(character_token_path))
-
-        # Arranging amd and non_amd
-        all_amd = amd_paths + non_amd_paths
-        all_backs = amd_backs + non_amd_backs
-
-        all_amd_cards = [LatexFileGenerator.sanitize_path(str(p)) for p in (all_amd + all_backs)]
-        latex_code += self.amd_cards([str(c) for c in all_amd_cards])
-
-        # Character mat and mini
-        mat_mini_paths = []
-        for filename in ["character_mat", "character_mat_back", "character_mini"]:
-            jpg_file = Path(self.path_to_root_dir / filename).with_suffix(".jpg")
-            if not jpg_file.exists():
-                jpg_file = Path(self.path_to_root_dir / filename).with_suffix(".png")
-            mat_mini_paths.append(jpg_file)
-        mat_mini_paths = [LatexFileGenerator.sanitize_path(str(p)) for p in (mat_mini_paths)]
-        latex_code += self.character_mat(str(mat_mini_paths[0]), str(mat_mini_paths[1]), str(mat_mini_paths[2]), str(character_token_path))
-
-        # Summons and overlay tokens
-        summon_paths = None
-        if Path(self.path_to_root_dir / "summons").exists():
-            summon_paths = list(Path(self.path_to_root_dir / "summons").glob("*.jpg")) + list(
-                Path(self.path_to_root_dir / "summons").glob("*.png"))
-            summon_paths.sort()
-            summon_paths = [LatexFileGenerator.sanitize_path(str(p)) for p in (summon_paths)]
-
-        overlay_tokens_paths = None
-        if Path(self.path_to_root_dir / "OverlayTokens").exists():
-            overlay_tokens_paths = list(Path(self.path_to_root_dir / "OverlayTokens").glob("*.jpg")) + list(
-                Path(self.path_to_root_dir / "OverlayTokens").glob("*.png"))
-            overlay_tokens_paths.sort()
-            overlay_tokens_paths = [LatexFileGenerator.sanitize_path(str(p)) for p in (overlay_tokens_paths)]
-
-        latex_code += self.summons_and_tokens(summon_paths, overlay_tokens_paths)
-
-        # Character sheet
-        sheet = Path(self.path_to_root_dir / "character_sheet.jpg")
-        if not sheet.exists():
-            sheet = Path(self.path_to_root_dir / "character_sheet.png")
-        sheet = LatexFileGenerator.sanitize_path(str(sheet))
-        latex_code += self.character_sheet(str(sheet))
-        latex_code += self.end_document()
-
-        with open(self.output_path, "w") as f:
-            f.write(latex_code)
+        # Stream each section straight to the file so the peak memory is one
+        # section, not the whole document; the 64 KiB buffer batches syscalls.
+        with open(self.output_path, "w", buffering=1 << 16) as f:
+            f.write(self.header())
+
+            # Ability cards
+            card_paths = self._list_images(self.path_to_root_dir / "AbilityCards")
+            card_back_path = LatexFileGenerator.sanitize_path(self._root_index["ability_card_back"])
+            f.write(self.ability_cards(card_paths, card_back_path))
+
+            # #AMD
+            amd_paths = self._list_images(self.path_to_root_dir / "AMD")
+            amd_back_path = LatexFileGenerator.sanitize_path(self._root_index["amd_back"])
+
+            # NON_AMD
+            non_amd_paths = self._list_images(self.path_to_root_dir / "NON_AMD")
+            non_amd_back_path = LatexFileGenerator.sanitize_path(self._root_index["non_amd_back"])
+
+            # Characater tokens
+            character_token_path = LatexFileGenerator.sanitize_path(self._root_index["character_token"])
+
+            # Arranging amd and non_amd: all the fronts, then one back per
+            # front, without materializing the repeated-back lists.
+            all_amd_cards = chain(amd_paths, non_amd_paths,
+                                  repeat(amd_back_path, len(amd_paths)),
+                                  repeat(non_amd_back_path, len(non_amd_paths)))
+            f.write(self.amd_cards(all_amd_cards))
+
+            # Character mat and mini
+            mat_mini_paths = [LatexFileGenerator.sanitize_path(self._root_index[filename])
+                              for filename in ["character_mat", "character_mat_back", "character_mini"]]
+            f.write(self.character_mat(mat_mini_paths[0], mat_mini_paths[1], mat_mini_paths[2], character_token_path))
+
+            # Summons and overlay tokens
+            summon_paths = None
+            if "summons" in self._root_entries:
+                summon_paths = self._list_images(self.path_to_root_dir / "summons")
+
+            overlay_tokens_paths = None
+            if "OverlayTokens" in self._root_entries:
+                overlay_tokens_paths = self._list_images(self.path_to_root_dir / "OverlayTokens")
+
+            f.write(self.summons_and_tokens(summon_paths, overlay_tokens_paths))
+
+            # Character sheet
+            sheet = LatexFileGenerator.sanitize_path(self._root_index["character_sheet"])
+            f.write(self.character_sheet(sheet))
+            f.write(self.end_document())
 
     def header(self):
-        header_string = r"\documentclass[12pt,"
-        if self.is_a4:
-            header_string += "a4paper"
-        else:
-            header_string += "letterpaper"
-        return header_string + r""",notitlepage,landscape]{article}
-\usepackage{graphicx}
-\usepackage{subcaption}
-\usepackage{pdflscape}
-\usepackage[space]{grffile}
-
-\pagenumbering{gobble}
-
-\addtolength{\topmargin}{-3.4cm}
-\begin{document}
-
-"""
+        return self._HEADERS[self.is_a4]
 
     def end_document(self):
         return r"\end{document}"
 
     def character_sheet(self, path_to_sheet: str):
-        res = r"""\clearpage
-
-\begin{figure}[ht]
-\centering
-\makebox[1\textwidth]{
-\includegraphics[height=14cm]{" """ + path_to_sheet + r""" "} \hspace{0cm}%
-\includegraphics[height=14cm]{" """ + path_to_sheet + r""" "}
-}
-\end{figure}
-
-"""
+        res = self._SHEET_TMPL % {"p": path_to_sheet}
         return res + res  # Back of the character sheet is the same as the front for now
 
-    def amd_cards_one_page(self,
-                           amd_paths: list[str]):
-        """
-        Helper function to generate latex code for a single AMD page. Holds up 10 cards
-        in two rows of 5.
-        """
-        res = r"""\begin{figure}[ht]
-  \centering
-\setkeys{Gin}{width=6.9cm}
-\makebox[1\textwidth]{
-"""
+    def _amd_include_lines(self, amd_paths: list[str]):
         add_rotation = ""
         # TODO: add no rotation case?
         if self.rotate_amd_cards:
             add_rotation = "angle=90, "
-        for i in range(len(amd_paths)):
-            res += r"  \includegraphics[" + add_rotation + r"width=4.4cm]{""" + '"' + amd_paths[i] + '"' + r"}"
-            if i != len(amd_paths) - 1 and i != 4:
-                res += r"\hspace{0cm}%" + "\n"
-            if i == 4:  # create new line of AMDs
-                res += r"""
-}
-\makebox[\textwidth]{
-"""
-        res += r"""
-}
-\end{figure}
-
-\clearpage
+        include_prefix = f"  \\includegraphics[{add_rotation}width=4.4cm]{{\""
+        return [f"{include_prefix}{p}\"}}" for p in amd_paths]
 
-"""
-        return res
+    def _amd_page_full(self, amd_paths: list[str]):
+        """
+        Generates latex code for a full AMD page: 10 cards in two rows of 5,
+        emitted straight-line with no per-card branching.
+        """
+        lines = self._amd_include_lines(amd_paths)
+        return (self._AMD_PAGE_OPEN + _HSPACE_NL.join(lines[:5]) + self._ROW_BREAK
+                + _HSPACE_NL.join(lines[5:]) + self._PAGE_CLOSE)
 
-    def amd_cards(self, amd_paths: list[str]):
-        res = ""
-        n = len(amd_paths)
+    def _amd_page_partial(self, amd_paths: list[str]):
+        """
+        Generates latex code for the last, partially filled AMD page. A second
+        row is opened as soon as the first one holds 5 cards, matching the
+        historical layout even when that row stays empty.
+        """
+        lines = self._amd_include_lines(amd_paths)
+        body = _HSPACE_NL.join(lines[:5])
+        if len(lines) > 5:
+            body += self._ROW_BREAK + _HSPACE_NL.join(lines[5:])
+        elif len(lines) == 5:
+            body += self._ROW_BREAK
+        return self._AMD_PAGE_OPEN + body + self._PAGE_CLOSE
+
+    def amd_cards(self, amd_paths):
+        parts = []
         cards_per_page = 10
-        num_pages = (n + cards_per_page - 1) // cards_per_page  # ceil division
-
-        for i in range(num_pages):
-            amds_in_page = amd_paths[cards_per_page * i: cards_per_page * (i + 1)]
-            res += self.amd_cards_one_page(amds_in_page)
-        return res
+        it = iter(amd_paths)
+        while amds_in_page := list(islice(it, cards_per_page)):
+            if len(amds_in_page) == cards_per_page:
+                parts.append(self._amd_page_full(amds_in_page))
+            else:
+                parts.append(self._amd_page_partial(amds_in_page))
+        return "".join(parts)
 
     def ability_cards_one_page(self,
-                               card_paths: list[str]):
+                               card_paths: list[str] | None,
+                               repeated_back: str | None = None,
+                               n: int = 0):
         """
         Helper function to generate latex code for a single page. Holds up
         to a maximum of 8 ability cards, or 6 if using US Letter format with bleed.
+        For a page of card backs, pass repeated_back and n instead of card_paths:
+        the same back is emitted n times without building an intermediate list.
         """
-        res = r"""\begin{figure}[ht]
-  \centering
-\setkeys{Gin}{width="""
-        # Make sure the final cards have the same physical size (ie cards printed with bleed, but with bleed cut out, and cards printed without bleed)
-        if self.has_bleed:
-            res += "6.99cm"
+        parts = [self._ABILITY_PAGE_OPEN % self._ability_width]
+        cards_per_line = self._cards_per_line
+        if repeated_back is not None:
+            back_line = f"   \\includegraphics{{\"{repeated_back}\"}}"
+            for i in range(n):
+                parts.append(back_line)
+                if i != n - 1 and i != cards_per_line - 1:
+                    parts.append(_HSPACE_NL)
+                if i == cards_per_line - 1:
+                    parts.append(self._ROW_BREAK)
         else:
-            res += "6.35cm"
-        res += r"""}
-\makebox[1\textwidth]{
-"""
-        cards_per_line = 4
-        if not self.is_a4 and self.has_bleed:
-            cards_per_line = 3
-        for i in range(len(card_paths)):
-            res += r"   \includegraphics{" + '"' + card_paths[i] + '"' + r"}"
-            if i != len(card_paths) - 1 and i != cards_per_line - 1:
-                res += r"\hspace{0cm}%" + "\n"
-            if i == cards_per_line - 1:
-                res += r"""
-}
-\makebox[\textwidth]{
-"""
+            for i in range(len(card_paths)):
+                parts.append(f"   \\includegraphics{{\"{card_paths[i]}\"}}")
+                if i != len(card_paths) - 1 and i != cards_per_line - 1:
+                    parts.append(_HSPACE_NL)
+                if i == cards_per_line - 1:
+                    parts.append(self._ROW_BREAK)
         # end of the for loop
-        res += r"""
-}
-\end{figure}
-
-\clearpage
-
-"""
-        return res
+        parts.append(self._PAGE_CLOSE)
+        return "".join(parts)
 
     def ability_cards(self,
                       card_paths: list[str],  # list of paths to the cards
                       ability_card_back: str):
 
-        cards_per_line = 4
-        if not self.is_a4 and self.has_bleed:
-            cards_per_line = 3
-        res = ""
+        per_page = 2 * self._cards_per_line
+        parts = []
         # Subdivide card_paths into group of 6 or 8 cards if possible
-        for i in range(len(card_paths) // (2 * cards_per_line) + 1):
-            cards_in_page = card_paths[2 * cards_per_line * i:2 * cards_per_line * (i + 1)]
-            res += self.ability_cards_one_page(cards_in_page)
+        it = iter(card_paths)
+        while cards_in_page := list(islice(it, per_page)):
+            parts.append(self.ability_cards_one_page(cards_in_page))
             # Ability card background
-            res += self.ability_cards_one_page([ability_card_back for _ in range(len(cards_in_page))])
-        return res
+            parts.append(self.ability_cards_one_page(None, repeated_back=ability_card_back,
+                                                     n=len(cards_in_page)))
+        return "".join(parts)
 
     def character_mat(self,
                   mat_front_path: str,
                   mat_back_path: str,
                   characer_mini_path: str,
                   token_path: str):
-        res = r"""\begin{figure}[ht]
-        \centering
-        \makebox[1\textwidth]{
-            \includegraphics[angle=90,width=9.5cm,height=14.5cm]{" """ + mat_front_path + r""" "}\hspace{0.5cm}%
-            \includegraphics[angle=90,width=9.5cm,height=14.5cm]{" """ + mat_back_path + r""" "}\hspace{0.5cm}%
-            \raisebox{7.5cm}[0pt][0pt]{%
-                \parbox[c]{4cm}{
-                    \includegraphics[width=4cm]{" """ + characer_mini_path + r""" "}\\[0.5cm]
-                    \scalebox{-1}[1]{\includegraphics[width=4cm]{" """ + characer_mini_path + r""" "}}%
-                }
-            }
-        }
-        
-        \vspace{0.5cm}
-        \makebox[1\textwidth]{%
-"""
+        parts = [self._MAT_TMPL % {"front": mat_front_path,
+                                   "back": mat_back_path,
+                                   "mini": characer_mini_path}]
+        token = f"  \\includegraphics[width=1.45cm]{{\"{token_path}\"}}"
+        token_mirrored = f"  \\scalebox{{-1}}[1]{{\\includegraphics[width=1.45cm]{{\"{token_path}\"}}}}"
         # First row: 10 normal tokens
-        for i in range(10):
-            res += r"  \includegraphics[width=1.45cm]{""" + '"' + token_path + '"' + r"}"
-            if i != 9:
-                res += r"\hspace{0cm}%"
-            res += "\n"
+        parts.append(_HSPACE_NL.join([token] * 10) + "\n")
 
-        res += r"""
+        parts.append(r"""
     }
     \makebox[1\textwidth]{%
-"""
+""")
         # Second row: 10 flipped tokens
-        for i in range(10):
-            res += r"  \scalebox{-1}[1]{\includegraphics[width=1.45cm]{""" + '"' + token_path + '"' + r"}}"
-            if i != 9:
-                res += r"\hspace{0cm}%"
-            res += "\n"
+        parts.append(_HSPACE_NL.join([token_mirrored] * 10) + "\n")
 
-        res += r"""
+        parts.append(r"""
         }
         \end{figure}
         \clearpage
-        """
-        return res
+        """)
+        return "".join(parts)
 
     def summons_and_tokens(self,
                        summon_paths: list[str] | None = None,
@@ -330,9 +356,9 @@ class LatexFileGenerator():
         if not summon_paths and not overlay_token_paths:
             return ""
 
-        res = r"""\begin{figure}[ht]
+        parts = [r"""\begin{figure}[ht]
 \centering
-"""
+"""]
 
         max_width_cm = 28.0
         spacing_cm = 0.2
@@ -340,73 +366,78 @@ class LatexFileGenerator():
         # --- Summons (normal + flipped) ---
         if summon_paths:
             current_width = 0.0
-            res += r"\makebox[1\textwidth]{" + "\n"
+            parts.append(r"\makebox[1\textwidth]{" + "\n")
             for i, path in enumerate(summon_paths):
                 for flipped in [False, True]:
                     graphic = (r"\scalebox{-1}[1]{\includegraphics[width=4cm]{""" + '"' + path + '"' + r"}}"
                                if flipped else
                                r"\includegraphics[width=4cm]{""" + '"' + path + '"' + r"}")
                     if current_width + 4.0 > max_width_cm:
-                        res += r"""
+                        parts.append(r"""
 }
 \vspace{0.3cm}
-\makebox[1\textwidth]{""" + "\n"
+\makebox[1\textwidth]{""" + "\n")
                         current_width = 0.0
-                    res += "  " + graphic + "\n"
+                    parts.append("  " + graphic + "\n")
                     current_width += 4.0
                     if current_width + spacing_cm <= max_width_cm:
-                        res += r"\hspace{" + f"{spacing_cm}cm" + r"}%" + "\n"
+                        parts.append(r"\hspace{" + f"{spacing_cm}cm" + r"}%" + "\n")
                         current_width += spacing_cm
-            res += r"""
+            parts.append(r"""
 }
 \vspace{0.3cm}
-"""
+""")
 
         # --- Overlay Tokens (normal + flipped) ---
         if overlay_token_paths:
             current_width = 0.0
-            res += r"\makebox[1\textwidth]{" + "\n"
+            parts.append(r"\makebox[1\textwidth]{" + "\n")
             for i, path in enumerate(overlay_token_paths):
                 for flipped in [False, True]:
                     graphic = (r"\scalebox{-1}[1]{\includegraphics[width=2.7cm,height=2.7cm]{""" + '"' + path + '"' + r"}}"
                                if flipped else
                                r"\includegraphics[width=2.7cm,height=2.7cm]{""" + '"' + path + '"' + r"}")
                     if current_width + 2.7 > max_width_cm:
-                        res += r"""
+                        parts.append(r"""
 }
 \vspace{0.3cm}
-\makebox[1\textwidth]{""" + "\n"
+\makebox[1\textwidth]{""" + "\n")
                         current_width = 0.0
-                    res += "  " + graphic + "\n"
+                    parts.append("  " + graphic + "\n")
                     current_width += 2.7
                     if current_width + spacing_cm <= max_width_cm:
-                        res += r"\hspace{" + f"{spacing_cm}cm" + r"}%" + "\n"
+                        parts.append(r"\hspace{" + f"{spacing_cm}cm" + r"}%" + "\n")
                         current_width += spacing_cm
-            res += r"""
+            parts.append(r"""
 }
-"""
+""")
 
-        res += r"""
+        parts.append(r"""
 \end{figure}
 \clearpage
-"""
-        return res
-
-
-
-argparser = argparse.ArgumentParser()
-argparser.add_argument("path_to_root_dir", action="store", metavar="",
-                       help="path to the directory containing all images of the custom class")
-argparser.add_argument("output_path", action="store", metavar="",
-                       help="path to the output LaTeX file.")
-argparser.add_argument("--is_A4", action=argparse.BooleanOptionalAction, default=True,
-                       help='if the PNP file should be A4 (True) or US_letter (False). Default is A4')
-argparser.add_argument("--with_bleed", action=argparse.BooleanOptionalAction, default=True,
-                       help="if the ability cards don't have bleed, change this to False.")
-arguments = argparser.parse_args()
-
-filegen = LatexFileGenerator(arguments.path_to_root_dir,
-                             arguments.output_path,
-                             arguments.is_A4,
-                             arguments.with_bleed)
-filegen.generate_latex_file()
+""")
+        return "".join(parts)
+
+
+
+def main():
+    argparser = argparse.ArgumentParser()
+    argparser.add_argument("path_to_root_dir", action="store", metavar="",
+                           help="path to the directory containing all images of the custom class")
+    argparser.add_argument("output_path", action="store", metavar="",
+                           help="path to the output LaTeX file.")
+    argparser.add_argument("--is_A4", action=argparse.BooleanOptionalAction, default=True,
+                           help='if the PNP file should be A4 (True) or US_letter (False). Default is A4')
+    argparser.add_argument("--with_bleed", action=argparse.BooleanOptionalAction, default=True,
+                           help="if the ability cards don't have bleed, change this to False.")
+    arguments = argparser.parse_args()
+
+    filegen = LatexFileGenerator(arguments.path_to_root_dir,
+                                 arguments.output_path,
+                                 arguments.is_A4,
+                                 arguments.with_bleed)
+    filegen.generate_latex_file()
+
+
+if __name__ == "__main__":
+    main()